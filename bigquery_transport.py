@@ -0,0 +1,172 @@
+import os
+import math
+import logging
+import threading
+import time
+from collections import deque
+
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Applied when a caller passes no timeout or timeout=None (google-cloud-core always
+# passes BigQuery's DEFAULT_TIMEOUT, which is None), so no call blocks forever.
+DEFAULT_TIMEOUT = 120.0
+
+# Pass timeout=NO_TIMEOUT to opt a single request out of the default timeout
+NO_TIMEOUT = object()
+
+
+def load_http_config():
+    """Read BigQuery HTTP transport settings from BQ_HTTP_* environment variables"""
+    def read(name, cast, default):
+        value = os.getenv(name)
+        if value is None or value.strip() == "":
+            return default
+        try:
+            return cast(value)
+        except ValueError:
+            raise ValueError(f"Invalid value for {name}: {value!r}")
+
+    def timeout_value(value):
+        # "none" disables the default timeout (calls may then run unbounded)
+        return None if value.strip().lower() == "none" else float(value)
+
+    config = {
+        "pool_maxsize": read("BQ_HTTP_POOL_MAXSIZE", int, 50),
+        "max_retries": read("BQ_HTTP_MAX_RETRIES", int, 3),
+        "backoff_factor": read("BQ_HTTP_BACKOFF_FACTOR", float, 0.5),
+        "timeout": read("BQ_HTTP_TIMEOUT", timeout_value, DEFAULT_TIMEOUT),
+    }
+
+    if config["pool_maxsize"] < 1:
+        raise ValueError("BQ_HTTP_POOL_MAXSIZE must be at least 1")
+    if config["max_retries"] < 0:
+        raise ValueError("BQ_HTTP_MAX_RETRIES must not be negative")
+    if config["backoff_factor"] < 0:
+        raise ValueError("BQ_HTTP_BACKOFF_FACTOR must not be negative")
+    if config["timeout"] is not None and config["timeout"] <= 0:
+        raise ValueError("BQ_HTTP_TIMEOUT must be greater than 0")
+    return config
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class RequestMetrics:
+    """Thread-safe record of recent HTTP requests made by the BigQuery client"""
+
+    def __init__(self, max_records=1000):
+        self._lock = threading.Lock()
+        self._records = deque(maxlen=max_records)
+        self._total_requests = 0
+        self._transport_errors = 0
+        self._server_errors = 0
+        self._client_errors = 0
+
+    def record(self, method, url, status, seconds):
+        """Record one request; status is None when no response was received"""
+        with self._lock:
+            self._records.append({
+                "time": time.time(),
+                "method": method,
+                "url": url,
+                "status": status,
+                "seconds": seconds,
+            })
+            self._total_requests += 1
+            if status is None:
+                self._transport_errors += 1
+            elif status >= 500:
+                self._server_errors += 1
+            elif status >= 400:
+                # Often expected, e.g. a 404 from get_table on a missing table
+                self._client_errors += 1
+        logger.debug("BigQuery HTTP %s %s -> %s in %.1f ms", method, url, status, seconds * 1000)
+
+    def summary(self):
+        """Return totals plus latency percentiles over the recent records, overall and per method"""
+        with self._lock:
+            records = list(self._records)
+            totals = {
+                "total_requests": self._total_requests,
+                "transport_errors": self._transport_errors,
+                "server_errors": self._server_errors,
+                "client_errors": self._client_errors,
+            }
+
+        def latency(rows):
+            seconds = [row["seconds"] for row in rows]
+            return {
+                "requests": len(rows),
+                "p50_ms": percentile(seconds, 50) * 1000,
+                "p95_ms": percentile(seconds, 95) * 1000,
+                "max_ms": max(seconds) * 1000 if seconds else 0.0,
+            }
+
+        by_method = {}
+        for row in records:
+            by_method.setdefault(row["method"], []).append(row)
+
+        summary = dict(totals)
+        summary.update(latency(records))
+        summary["by_method"] = {method: latency(rows) for method, rows in sorted(by_method.items())}
+        return summary
+
+
+class PooledAuthorizedSession(AuthorizedSession):
+    """Authorized session with a sized connection pool, connect retries and request metrics"""
+
+    def __init__(self, credentials, pool_maxsize=50, max_retries=3, backoff_factor=0.5,
+                 timeout=DEFAULT_TIMEOUT, metrics=None):
+        super().__init__(credentials)
+        # Only retry failures to connect: the request never reached the server, so
+        # this is safe for any method. Retries on 429/5xx responses are left to
+        # google-api-core's DEFAULT_RETRY so attempts are not multiplied per layer.
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=0,
+            status=0,
+            status_forcelist=(),
+            backoff_factor=backoff_factor,
+            raise_on_status=False,
+        )
+        # The pool is non-blocking: requests never passes a pool timeout to urllib3,
+        # so pool_block=True would let a session wait forever for a free connection.
+        # Past pool_maxsize concurrent requests, extra connections are opened and
+        # closed after use. Size pool_maxsize to the expected concurrency.
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self.default_timeout = timeout
+        self.metrics = metrics if metrics is not None else RequestMetrics()
+
+    def request(self, method, url, *args, **kwargs):
+        # AuthorizedSession re-enters request() after refreshing credentials on a
+        # 401; only the outermost call is recorded so each request counts once.
+        if "_credential_refresh_attempt" in kwargs:
+            return super().request(method, url, *args, **kwargs)
+
+        # None means "not set" here: BigQuery passes timeout=None on every call
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.default_timeout
+        elif kwargs["timeout"] is NO_TIMEOUT:
+            kwargs["timeout"] = None
+
+        start = time.perf_counter()
+        status = None
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            self.metrics.record(method, url, status, time.perf_counter() - start)
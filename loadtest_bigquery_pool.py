@@ -0,0 +1,130 @@
+"""Concurrency load test for the BigQuery HTTP transport.
+
+Starts a local stand-in HTTP endpoint and drives the shared session from 1, 10
+and 50 simultaneous sessions (threads), comparing the default AuthorizedSession
+pool with PooledAuthorizedSession. Reports throughput, p95 latency and how many
+TCP connections the endpoint had to accept.
+
+    python loadtest_bigquery_pool.py
+    python loadtest_bigquery_pool.py --sessions 1,10,50,100 --requests 50 --latency-ms 20
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from google.auth.credentials import AnonymousCredentials
+from google.auth.transport.requests import AuthorizedSession
+
+from bigquery_transport import PooledAuthorizedSession, load_http_config, percentile
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers every request like a small BigQuery API response after a fixed delay"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is visible
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        time.sleep(self.server.latency)
+        body = json.dumps({"kind": "bigquery#table", "id": "stand-in"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, latency):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.connections = 0
+
+
+def run_load(session, url, sessions, requests_per_session):
+    """Run `sessions` threads sharing one HTTP session; return (elapsed, latencies, errors)"""
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(sessions + 1)
+
+    def worker():
+        barrier.wait()
+        for _ in range(requests_per_session):
+            start = time.perf_counter()
+            try:
+                session.get(url, timeout=30).raise_for_status()
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+                continue
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+
+    threads = [threading.Thread(target=worker) for _ in range(sessions)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", default="1,10,50", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=50, help="requests per session")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="stand-in endpoint delay")
+    args = parser.parse_args()
+
+    http_config = load_http_config()
+    server = StandInServer(args.latency_ms / 1000.0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/bigquery/v2/projects/stand-in/datasets/master/tables/leads"
+
+    transports = {
+        "default": lambda: AuthorizedSession(AnonymousCredentials()),
+        "pooled": lambda: PooledAuthorizedSession(AnonymousCredentials(), **http_config),
+    }
+
+    print(f"Stand-in endpoint latency {args.latency_ms:.0f} ms, {args.requests} requests per session, "
+          f"pooled pool_maxsize={http_config['pool_maxsize']}")
+    print(f"{'transport':<10} {'sessions':>8} {'req/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'conns':>6} {'errors':>6}")
+    for sessions in [int(level) for level in args.sessions.split(",")]:
+        for name, make_session in transports.items():
+            session = make_session()
+            with server.lock:
+                server.connections = 0
+            elapsed, latencies, errors = run_load(session, url, sessions, args.requests)
+            session.close()
+            print(f"{name:<10} {sessions:>8} {len(latencies) / elapsed:>10.1f} "
+                  f"{percentile(latencies, 50) * 1000:>8.1f} {percentile(latencies, 95) * 1000:>8.1f} "
+                  f"{server.connections:>6} {len(errors):>6}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
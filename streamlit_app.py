@@ -3,6 +3,7 @@ import pandas as pd
 import streamlit as st
 from google.cloud import bigquery
 from google.oauth2 import service_account
+from bigquery_transport import PooledAuthorizedSession, RequestMetrics, load_http_config
 import time
 from datetime import date, timedelta
 
@@ -12,10 +13,19 @@ st.set_page_config(page_title="Leads Manager", page_icon="📊", layout="wide",
 # BigQuery configuration
 PROJECT_ID = "trimark-tdp"
 
+# Connection metrics cover every tenant's traffic, so only operators may see them
+SHOW_CONNECTION_METRICS = os.getenv('BQ_HTTP_SHOW_METRICS', '').strip().lower() in ('1', 'true', 'yes')
+
+@st.cache_resource
+def get_request_metrics():
+    """Shared record of HTTP requests made by the BigQuery client"""
+    return RequestMetrics()
+
 @st.cache_resource
 def init_bigquery_client():
     """Initialize BigQuery client with service account credentials"""
     try:
+        http_config = load_http_config()
         credentials = None
         
         # Method 1: Try Streamlit secrets (for deployment)
@@ -48,7 +58,12 @@ def init_bigquery_client():
         if not credentials:
             raise Exception("No valid credentials found. Please check your setup.")
         
-        client = bigquery.Client(credentials=credentials, project=PROJECT_ID)
+        # Share one pooled HTTP session across all session threads
+        client = bigquery.Client(
+            credentials=credentials,
+            project=PROJECT_ID,
+            _http=PooledAuthorizedSession(credentials, metrics=get_request_metrics(), **http_config),
+        )
         return client
         
     except Exception as e:
@@ -493,6 +508,24 @@ with st.sidebar:
         else:
             st.info(f"Predefined range: {date_range_options[date_range_type]}")
     
+    if SHOW_CONNECTION_METRICS:
+        with st.expander("🔌 Connection Metrics", expanded=False):
+            request_metrics = get_request_metrics().summary()
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Requests", request_metrics["total_requests"])
+                st.metric("Server Errors (5xx)", request_metrics["server_errors"])
+                st.metric("p50 Latency", f"{request_metrics['p50_ms']:.0f} ms")
+            with col2:
+                st.metric("Transport Errors", request_metrics["transport_errors"])
+                st.metric("Client Errors (4xx)", request_metrics["client_errors"])
+                st.metric("p95 Latency", f"{request_metrics['p95_ms']:.0f} ms")
+            if request_metrics["by_method"]:
+                st.dataframe(
+                    pd.DataFrame.from_dict(request_metrics["by_method"], orient="index").round(1),
+                    use_container_width=True
+                )
+    
     st.markdown("---")
     
     if st.button("🚪 Logout", use_container_width=True):